@@ -0,0 +1,44 @@
+import trio
+
+import pyctor
+from pyctor.behaviors import Behaviors
+from pyctor.types import Behavior
+
+"""
+Simple functional example how to spawn a behavior that handles read only messages concurrently
+"""
+
+
+async def message_handler(msg: str) -> Behavior[str]:
+    if msg == "stop":
+        print("message behavior is stopping")
+        return Behaviors.Stop
+    print(f"message behavior is reading: {msg}")
+    # other read only messages are handled while this one sleeps
+    await trio.sleep(1)
+    print(f"message behavior has read: {msg}")
+    return Behaviors.Same
+
+
+def is_mutating(msg: str) -> bool:
+    return msg == "stop"
+
+
+async def main() -> None:
+    print("behavior tree is starting up")
+    message_behavior = Behaviors.receive_concurrent(message_handler, mutating=is_mutating)
+
+    async with pyctor.open_nursery() as n:
+        # spawn the behavior
+        message_ref = await n.spawn(message_behavior)
+
+        for i in range(10):
+            message_ref.send(f"Hi from the Behavior Tree {i}")
+
+        # waits until all reads are done
+        message_ref.send("stop")
+    print("behavior tree was shut down")
+
+
+if __name__ == "__main__":
+    trio.run(main)
@@ -1,3 +1,3 @@
-from .system import open_nursery, open_multiprocess_nursery
+from .system import open_nursery, open_multiprocess_nursery, open_event_driven_nursery
 from .behaviors import Behaviors
 from .types import Behavior
\ No newline at end of file
@@ -0,0 +1,97 @@
+from logging import getLogger
+from typing import Callable
+
+import trio
+import trio.lowlevel
+
+import pyctor.behaviors
+import pyctor.types
+
+logger = getLogger(__name__)
+
+
+class ConcurrentBehaviorHandlerImpl(pyctor.types.BehaviorHandler[pyctor.types.T]):
+    """
+    Handles messages that do not mutate the state of the behavior concurrently in the given nursery.
+    A mutating message waits until all concurrently handled messages are done and is then handled on its own,
+    so the behavior is serial again whenever a mutating message arrives.
+    An exception raised by a concurrently handled message is raised again when the next message is handled,
+    so that it is seen by the behavior task and a supervise around it, and not by the nursery.
+    """
+
+    __slots__ = ("_behavior", "_mutating", "_nursery", "_in_flight", "_idle", "_error")
+
+    _behavior: pyctor.types.BehaviorFunction[pyctor.types.T]
+    _mutating: Callable[[pyctor.types.T], bool]
+    """
+    Decides if a message mutates the state of the behavior and therefore has to be handled on its own
+    """
+    _nursery: trio.Nursery
+    """
+    The nursery the non mutating messages are handled in
+    """
+    _in_flight: int
+    """
+    The amount of non mutating messages that are currently handled
+    """
+    _idle: trio.lowlevel.ParkingLot
+    """
+    Mutating messages park here until no other message is handled anymore
+    """
+    _error: Exception | None
+    """
+    The first exception raised by a concurrently handled message that has not been raised again yet
+    """
+
+    def __init__(
+        self,
+        behavior: pyctor.types.BehaviorFunction[pyctor.types.T],
+        mutating: Callable[[pyctor.types.T], bool],
+        nursery: trio.Nursery,
+    ) -> None:
+        self._behavior = behavior
+        self._mutating = mutating
+        self._nursery = nursery
+        self._in_flight = 0
+        self._idle = trio.lowlevel.ParkingLot()
+        self._error = None
+
+    async def handle(self, msg: pyctor.types.T) -> pyctor.types.Behavior[pyctor.types.T]:
+        self._raise_error()
+        if self._mutating(msg):
+            while self._in_flight:
+                await self._idle.park()
+            # one of the awaited messages might have failed
+            self._raise_error()
+            return await self._behavior(msg)
+        self._in_flight += 1
+        self._nursery.start_soon(self._handle_concurrent, msg)
+        return pyctor.behaviors.Behaviors.Same
+
+    async def _handle_concurrent(self, msg: pyctor.types.T) -> None:
+        try:
+            new_behavior = await self._behavior(msg)
+            if new_behavior is not pyctor.behaviors.Behaviors.Same:
+                logger.warning("Non mutating messages can only return Behaviors.Same, ignoring: %s", new_behavior)
+        except Exception as e:
+            # raising here would crash the nursery, keep the exception for the next message instead
+            if self._error is None:
+                self._error = e
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.unpark_all()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    def _log_error(self) -> None:
+        """
+        Logs an exception that has not been raised again, because no message has been handled after it.
+        """
+        if self._error is not None:
+            logger.error("Exception while handling a message concurrently: %s", self._error, exc_info=self._error)
+            self._error = None
@@ -0,0 +1,297 @@
+import math
+from collections import deque
+from logging import getLogger
+from types import FunctionType, coroutine
+from typing import Any, Coroutine, Deque, Generator, Generic
+
+import trio
+import trio.abc
+import trio.lowlevel
+
+import pyctor.behavior.mailbox
+import pyctor.behavior.process
+import pyctor.behaviors
+import pyctor.context
+import pyctor.system
+import pyctor.types
+
+logger = getLogger(__name__)
+
+
+@coroutine
+def _resume(coro: Coroutine[Any, Any, Any], trap: Any) -> Generator[Any, Any, Any]:
+    """
+    Continues a coroutine that has been started with coro.send and has yielded trap,
+    by passing everything between trio and the coroutine until it returns.
+    """
+    while True:
+        try:
+            value = yield trap
+        except BaseException as e:
+            try:
+                trap = coro.throw(e)
+            except StopIteration as done:
+                return done.value
+        else:
+            try:
+                trap = coro.send(value)
+            except StopIteration as done:
+                return done.value
+
+
+class EventDrivenScheduler:
+    """
+    A pool of worker tasks that handle the messages of event driven behaviors.
+    A behavior with queued messages is put into the run queue once and is then handled by the next free worker.
+    A handler that waits for something, e.g. for an ask to another behavior, keeps its worker until it is done.
+    Another worker is started in this case, so that waiting handlers never leave the run queue without workers.
+    Surplus workers end once their handler is done.
+    The workers are started with the first behavior and end when the last behavior has stopped,
+    so that the nursery they run in can be closed like with behaviors that have a task of their own.
+    """
+
+    _nursery: trio.Nursery
+    _workers: int
+    """
+    The amount of workers that handle the run queue while no handler is waiting
+    """
+    _running: int
+    """
+    The amount of worker tasks of the current run queue
+    """
+    _waiting: int
+    """
+    The amount of workers that wait within a handler
+    """
+    _behaviors: int
+    """
+    The amount of behaviors that have been started and not stopped yet
+    """
+    _send: trio.MemorySendChannel["EventDrivenBehaviorProcessor[Any]"] | None
+    """
+    The run queue, only available while the workers are running
+    """
+    _receive: trio.MemoryReceiveChannel["EventDrivenBehaviorProcessor[Any]"] | None
+
+    def __init__(self, nursery: trio.Nursery, workers: int) -> None:
+        self._nursery = nursery
+        self._workers = workers
+        self._running = 0
+        self._waiting = 0
+        self._behaviors = 0
+        self._send = None
+        self._receive = None
+
+    def add(self) -> None:
+        self._behaviors += 1
+        if self._send is None:
+            self._send, self._receive = trio.open_memory_channel(math.inf)
+            for _ in range(self._workers):
+                self._start_worker()
+
+    def remove(self) -> None:
+        self._behaviors -= 1
+        if not self._behaviors and self._send is not None:
+            # no behavior left, let the workers end.
+            # No handler is waiting anymore, workers that still finish their turn end with the closed run queue
+            self._send.close()
+            self._send = None
+            self._receive = None
+            self._running = 0
+
+    def schedule(self, processor: "EventDrivenBehaviorProcessor[Any]") -> None:
+        assert self._send is not None, "Can only schedule behaviors that have been started"
+        self._send.send_nowait(processor)
+
+    async def wait(self, coro: Coroutine[Any, Any, Any], trap: Any) -> Any:
+        """
+        Finishes a handler coroutine that did not return right away but has yielded trap to wait for something.
+        The calling worker is busy until then, so another worker takes over the run queue.
+        """
+        self._waiting += 1
+        if self._running - self._waiting < self._workers:
+            self._start_worker()
+        try:
+            return await _resume(coro, trap)
+        finally:
+            self._waiting -= 1
+
+    def start_task(self, processor: pyctor.behavior.process.BehaviorProcessorImpl[Any]) -> None:
+        """
+        Starts a behavior that has left the workers in a task of its own.
+        """
+        self._nursery.start_soon(processor.behavior_task)
+
+    def _start_worker(self) -> None:
+        self._running += 1
+        self._nursery.start_soon(self._worker, self._receive)
+
+    async def _worker(self, receive: trio.MemoryReceiveChannel["EventDrivenBehaviorProcessor[Any]"]) -> None:
+        async for processor in receive:
+            await processor.run()
+            if receive is self._receive and self._running - self._waiting > self._workers:
+                # another worker has taken over while this one was waiting
+                self._running -= 1
+                return
+
+
+class EventDrivenBehaviorProcessor(pyctor.types.Mailbox[pyctor.types.T], Generic[pyctor.types.T]):
+    """
+    Runs a BehaviorHandler without a task of its own.
+    The processor is the mailbox of the behavior, sending a message queues it and
+    hands the processor to the scheduler, whose workers then call run.
+    Only plain BehaviorHandlers run on the workers, setup and teardown need a task that enters and leaves them.
+    If the handler changes to such a Behavior, the behavior continues in a task of its own like any other Behavior
+    and the processor only forwards to its mailbox from then on.
+    The mailbox is not bounded, sending never waits.
+    """
+
+    __slots__ = ("_behavior", "_scheduler", "_ref", "_queue", "_scheduled", "_closed", "_stopped", "_mailbox")
+
+    _behavior: pyctor.types.BehaviorHandler[pyctor.types.T]
+    _scheduler: EventDrivenScheduler
+    _ref: pyctor.types.Ref[pyctor.types.T]
+    _queue: Deque[pyctor.types.T]
+    """
+    The messages that have not been handled yet
+    """
+    _scheduled: bool
+    """
+    The processor is in the run queue or is being run by a worker
+    """
+    _closed: bool
+    """
+    The mailbox has been closed, the behavior will handle the queued messages and then stop
+    """
+    _stopped: bool
+    """
+    The behavior has stopped, no more messages will be accepted
+    """
+    _mailbox: pyctor.behavior.mailbox.MailboxImpl[pyctor.types.T] | None
+    """
+    The mailbox of the task the behavior continues in, once it has left the workers
+    """
+
+    def __init__(self, behavior: pyctor.types.BehaviorHandler[pyctor.types.T], scheduler: EventDrivenScheduler) -> None:
+        super().__init__()
+        self._behavior = behavior
+        self._scheduler = scheduler
+        self._queue = deque()
+        self._scheduled = False
+        self._closed = False
+        self._stopped = False
+        self._mailbox = None
+
+    def start(self, ref: pyctor.types.Ref[pyctor.types.T]) -> None:
+        """
+        Needs to be called once the processor has been registered under the given ref.
+        """
+        self._ref = ref
+        self._scheduler.add()
+
+    def send_nowait(self, msg: pyctor.types.T) -> None:
+        # the mailbox is not bounded
+        self.send_overflow(msg)
+
+    def send_overflow(self, msg: pyctor.types.T) -> None:
+        if self._mailbox is not None:
+            self._mailbox.send_overflow(msg)
+            return
+        if self._closed:
+            raise trio.ClosedResourceError
+        if self._stopped:
+            raise trio.BrokenResourceError
+        self._queue.append(msg)
+        if not self._scheduled:
+            self._scheduled = True
+            self._scheduler.schedule(self)
+
+    async def send(self, msg: pyctor.types.T) -> None:
+        if self._mailbox is not None:
+            await self._mailbox.send(msg)
+            return
+        # a cancelled send must not deliver its message
+        await trio.lowlevel.checkpoint_if_cancelled()
+        self.send_nowait(msg)
+        await trio.lowlevel.cancel_shielded_checkpoint()
+
+    async def aclose(self) -> None:
+        if self._mailbox is not None:
+            await self._mailbox.aclose()
+            return
+        if not self._closed and not self._stopped:
+            self._closed = True
+            if not self._scheduled:
+                self._scheduled = True
+                self._scheduler.schedule(self)
+        await trio.lowlevel.checkpoint()
+
+    async def run(self) -> None:
+        """
+        Handles the messages that are queued right now, so that other behaviors get their turn.
+        Is called by a worker of the scheduler.
+        """
+        same = pyctor.behaviors.SAME
+        ignore = pyctor.behaviors.IGNORE
+        stop = pyctor.behaviors.STOP
+        restart = pyctor.behaviors.RESTART
+        queue = self._queue
+        handle = self._behavior.handle
+        for _ in range(len(queue)):
+            msg = queue.popleft()
+            coro = handle(msg)
+            try:
+                # most handlers return without waiting for anything, run them right here
+                trap = coro.send(None)
+            except StopIteration as done:
+                new_behavior = done.value
+            else:
+                new_behavior = await self._scheduler.wait(coro, trap)
+            if new_behavior is same or new_behavior is restart:
+                # a plain handler has no setup that could be restarted,
+                # the BehaviorProcessorImpl enters the same handler again in this case
+                continue
+            elif new_behavior is ignore:
+                logger.warning("Ignoring message: %s", type(msg))
+            elif new_behavior is stop:
+                await self._stop()
+                return
+            elif isinstance(new_behavior, FunctionType):
+                await self._start_task(new_behavior)
+                return
+            elif isinstance(new_behavior, pyctor.types.BehaviorHandler):
+                self._behavior = new_behavior
+                handle = new_behavior.handle
+            else:
+                # e.g. a missing return, the behavior stays the same like in the BehaviorProcessorImpl
+                logger.warning("The returned behavior has an incorrect type, keeping the behavior: %s", type(new_behavior))
+
+        if queue:
+            self._scheduler.schedule(self)
+        elif self._closed:
+            await self._stop()
+        else:
+            self._scheduled = False
+
+    async def _start_task(self, behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T]) -> None:
+        """
+        Continues the behavior in a task of its own, with the messages that have not been handled yet.
+        """
+        mailbox = pyctor.behavior.mailbox.MailboxImpl[pyctor.types.T](pyctor.behavior.process.MAILBOX_CAPACITY)
+        for msg in self._queue:
+            mailbox.send_overflow(msg)
+        self._queue.clear()
+        self._mailbox = mailbox
+        if self._closed:
+            await mailbox.aclose()
+        processor = pyctor.behavior.process.BehaviorProcessorImpl[pyctor.types.T](behavior=behavior, mailbox=mailbox, context=pyctor.context.ContextImpl(self._ref))
+        self._scheduler.start_task(processor)
+        # the task deregisters the behavior once it stops
+        self._scheduler.remove()
+
+    async def _stop(self) -> None:
+        self._stopped = True
+        self._queue.clear()
+        registry: pyctor.types.Registry = pyctor.system.registry.get()
+        await registry.deregister(self._ref)
+        self._scheduler.remove()
@@ -12,8 +12,10 @@ class BehaviorHandlerImpl(pyctor.types.BehaviorHandler[pyctor.types.T]):
     This class fullfills the Protocol requirements.
     """
 
+    __slots__ = ("_behavior", "_type", "handle")
+
     _behavior: pyctor.types.BehaviorFunction[pyctor.types.T]
-    _type: Type[pyctor.types.T] | None = None
+    _type: Type[pyctor.types.T] | None
 
     def __init__(
         self,
@@ -22,9 +24,16 @@ class BehaviorHandlerImpl(pyctor.types.BehaviorHandler[pyctor.types.T]):
     ) -> None:
         self._behavior = behavior
         self._type = type_check
+        # decide once whether messages need to be type checked,
+        # so that handling a message does not branch on it.
+        # Without a type check the behavior function already is the handler,
+        # which saves a wrapping coroutine per message.
+        if type_check is None:
+            self.handle = behavior  # type: ignore
+        else:
+            self.handle = self._handle_typed  # type: ignore
 
-    async def handle(self, msg: pyctor.types.T) -> pyctor.types.Behavior[pyctor.types.T]:
-        if self._type:
-            # if the type is given, we assert on it here
-            assert issubclass(type(msg), self._type), "Can only handle messages derived from type " + str(self._type) + ", got " + str(type(msg))
+    async def _handle_typed(self, msg: pyctor.types.T) -> pyctor.types.Behavior[pyctor.types.T]:
+        # the type is given, so we assert on it here
+        assert issubclass(type(msg), self._type), "Can only handle messages derived from type " + str(self._type) + ", got " + str(type(msg))  # type: ignore
         return await self._behavior(msg)
@@ -0,0 +1,147 @@
+from collections import deque
+from logging import getLogger
+from typing import Deque, Tuple
+
+import trio
+import trio.abc
+import trio.lowlevel
+
+import pyctor.types
+
+logger = getLogger(__name__)
+
+
+class MailboxImpl(pyctor.types.Mailbox[pyctor.types.T]):
+    """
+    The mailbox of a single behavior.
+    Any number of senders can put messages into the mailbox, but only the behavior task receives from it.
+    This allows plain deques and a parking lot instead of the bookkeeping of a trio memory channel.
+    The sending side fullfills the Mailbox interface, so that the mailbox can be registered as a channel.
+    """
+
+    __slots__ = ("_queue", "_capacity", "_blocked", "_receiver", "_closed", "_broken")
+
+    _queue: Deque[pyctor.types.T]
+    """
+    The messages that have not been received yet
+    """
+    _capacity: int
+    """
+    The amount of messages the behavior receives as one batch.
+    Senders using send wait while this many messages are queued, send_overflow never waits.
+    """
+    _receiver: trio.lowlevel.ParkingLot
+    """
+    The behavior task parks here while the mailbox is empty
+    """
+    _blocked: Deque[Tuple[trio.lowlevel.Task | None, pyctor.types.T]]
+    """
+    Senders that found the mailbox full together with their message, in the order they have been sent.
+    A sender waits until its message has been moved into the mailbox, overflowing messages have no sender.
+    """
+    _closed: bool
+    """
+    The sending side has been closed, the behavior will receive the queued messages and then stop
+    """
+    _broken: bool
+    """
+    The receiving side has been closed, no more messages will be accepted
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self._queue = deque()
+        self._capacity = capacity
+        self._blocked = deque()
+        self._receiver = trio.lowlevel.ParkingLot()
+        self._closed = False
+        self._broken = False
+
+    def send_nowait(self, msg: pyctor.types.T) -> None:
+        if self._closed:
+            raise trio.ClosedResourceError
+        if self._broken:
+            raise trio.BrokenResourceError
+        if len(self._queue) >= self._capacity:
+            raise trio.WouldBlock
+        self._queue.append(msg)
+        if self._receiver:
+            self._receiver.unpark()
+
+    def send_overflow(self, msg: pyctor.types.T) -> None:
+        if self._closed:
+            raise trio.ClosedResourceError
+        if self._broken:
+            raise trio.BrokenResourceError
+        if len(self._queue) >= self._capacity:
+            # queued behind the blocked senders, nobody waits for this message
+            self._blocked.append((None, msg))
+            return
+        self._queue.append(msg)
+        if self._receiver:
+            self._receiver.unpark()
+
+    async def send(self, msg: pyctor.types.T) -> None:
+        # a cancelled send must not deliver its message
+        await trio.lowlevel.checkpoint_if_cancelled()
+        try:
+            self.send_nowait(msg)
+        except trio.WouldBlock:
+            pass
+        else:
+            await trio.lowlevel.cancel_shielded_checkpoint()
+            return
+        # the behavior task hands the message over once there is room again,
+        # which keeps the order of the blocked senders
+        blocked = (trio.lowlevel.current_task(), msg)
+        self._blocked.append(blocked)
+
+        def abort(_: trio.lowlevel.RaiseCancelT) -> trio.lowlevel.Abort:
+            # a cancelled sender has not sent its message
+            self._blocked.remove(blocked)
+            return trio.lowlevel.Abort.SUCCEEDED
+
+        await trio.lowlevel.wait_task_rescheduled(abort)
+        if self._broken:
+            raise trio.BrokenResourceError
+
+    async def aclose(self) -> None:
+        # messages of blocked senders are still delivered before the end of the mailbox
+        self._closed = True
+        self._receiver.unpark_all()
+        await trio.lowlevel.checkpoint()
+
+    async def receive_batch(self) -> Deque[pyctor.types.T]:
+        """
+        Waits until there is at least one message in the mailbox and then returns all queued messages at once.
+        Raises trio.EndOfChannel if the sending side has been closed and all messages have been received.
+        """
+        if self._queue:
+            await trio.lowlevel.checkpoint()
+        else:
+            while not self._queue:
+                if self._broken:
+                    raise trio.ClosedResourceError
+                if self._closed:
+                    raise trio.EndOfChannel
+                await self._receiver.park()
+        batch = self._queue
+        self._queue = deque()
+        blocked = self._blocked
+        while blocked and len(self._queue) < self._capacity:
+            task, msg = blocked.popleft()
+            self._queue.append(msg)
+            if task is not None:
+                trio.lowlevel.reschedule(task)
+        return batch
+
+    def close_receive(self) -> None:
+        """
+        Closes the receiving side, queued messages are dropped and senders will get a trio.BrokenResourceError.
+        """
+        self._broken = True
+        self._queue.clear()
+        while self._blocked:
+            task, _ = self._blocked.popleft()
+            if task is not None:
+                trio.lowlevel.reschedule(task)
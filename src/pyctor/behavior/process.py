@@ -1,10 +1,13 @@
+from collections import deque
+from contextlib import nullcontext
 from logging import getLogger
 from types import FunctionType
-from typing import Generic
+from typing import Deque, Generic
 
 import trio
 
 import pyctor._util
+import pyctor.behavior.mailbox
 import pyctor.behaviors
 import pyctor.ref
 import pyctor.signals
@@ -13,20 +16,29 @@ import pyctor.system
 
 logger = getLogger(__name__)
 
+MAILBOX_CAPACITY: int = 1024
+"""
+The amount of messages a behavior receives from its mailbox as one batch.
+Only senders that use the async send of the mailbox wait while this many messages are queued.
+Ref.send never waits, for it the mailbox is not bounded and the capacity only limits the batch size.
+"""
+
 
 class BehaviorProcessorImpl(pyctor.types.BehaviorProcessor, Generic[pyctor.types.T]):
-    _channel: trio.abc.ReceiveChannel[pyctor.types.T]
-    _behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T]
+    __slots__ = ("_mailbox", "_behavior", "_context")
+
+    _mailbox: pyctor.behavior.mailbox.MailboxImpl[pyctor.types.T]
+    _behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T] | pyctor.types.BehaviorHandler[pyctor.types.T]
     _context: pyctor.types.Context[pyctor.types.T]
 
     def __init__(
         self,
-        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T],
-        channel: trio.abc.ReceiveChannel[pyctor.types.T],
+        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T] | pyctor.types.BehaviorHandler[pyctor.types.T],
+        mailbox: pyctor.behavior.mailbox.MailboxImpl[pyctor.types.T],
         context: pyctor.types.Context[pyctor.types.T],
     ) -> None:
         super().__init__()
-        self._channel = channel
+        self._mailbox = mailbox
         self._behavior = behavior
         self._context = context
 
@@ -36,53 +48,67 @@ class BehaviorProcessorImpl(pyctor.types.BehaviorProcessor, Generic[pyctor.types
         This method is a single task in the trio concept.
         Everything below this Behavior happens in this task.
         """
+        # local names for everything used per message
+        same = pyctor.behaviors.SAME
+        ignore = pyctor.behaviors.IGNORE
+        stop = pyctor.behaviors.STOP
+        restart = pyctor.behaviors.RESTART
+        mailbox = self._mailbox
         try:
             behavior = self._behavior
-            run = True
-            while run:
+            # messages that have been taken from the mailbox but not handled yet
+            pending: Deque[pyctor.types.T] = deque()
+            while True:
                 try:
-                    if not isinstance(behavior, FunctionType):  # pragma: no cover
-                        logger.error(
-                            f"The provided behavior has an incorrect type: {type(behavior)}"
-                        )
+                    if isinstance(behavior, FunctionType):
+                        context = behavior(self._context)
+                    elif isinstance(behavior, pyctor.types.BehaviorHandler):
+                        # a plain handler has no setup or teardown to run
+                        context = nullcontext(behavior)
+                    else:  # pragma: no cover
+                        logger.error("The provided behavior has an incorrect type: %s", type(behavior))
                         raise TypeError(behavior)
-                    async with behavior(self._context) as b:
-                        if not isinstance(
-                            b, pyctor.types.BehaviorHandler
-                        ):  # pragma: no cover
-                            logger.error(
-                                f"The provided behavior has an incorrect type: {type(b)}"
-                            )
+                    async with context as b:
+                        if not isinstance(b, pyctor.types.BehaviorHandler):  # pragma: no cover
+                            logger.error("The provided behavior has an incorrect type: %s", type(b))
                             raise TypeError(b)
+                        handle = b.handle
                         try:
                             while True:
-                                msg = await self._channel.receive()
-                                new_behavior = await b.handle(msg)
-                                match new_behavior:
-                                    case pyctor.behaviors.Behaviors.Ignore:
-                                        logger.warning("Ignoring message: %s", type(msg))
-                                    case pyctor.behaviors.Behaviors.Same:
-                                        pass
-                                    case pyctor.behaviors.Behaviors.Stop:
-                                        await self._channel.aclose()
-                                        run = False
-                                        break
-                                    case pyctor.behaviors.Behaviors.Restart:
-                                        # restart the behavior
-                                        break
-                                    case FunctionType():
-                                        # trust our asserts here...
-                                        behavior = new_behavior
-                                        break
+                                if not pending:
+                                    # take everything that is queued, so that a single
+                                    # wake up handles a whole batch of messages
+                                    pending = await mailbox.receive_batch()
+                                msg = pending.popleft()
+                                new_behavior = await handle(msg)
+                                # signals are singletons, so compare by identity,
+                                # ordered by how often they are returned
+                                if new_behavior is same:
+                                    continue
+                                elif new_behavior is ignore:
+                                    logger.warning("Ignoring message: %s", type(msg))
+                                elif new_behavior is stop:
+                                    mailbox.close_receive()
+                                    return
+                                elif new_behavior is restart:
+                                    # restart the behavior, pending messages are kept
+                                    break
+                                elif isinstance(new_behavior, FunctionType) or isinstance(new_behavior, pyctor.types.BehaviorHandler):
+                                    # trust our asserts here...
+                                    behavior = new_behavior
+                                    break
+                                else:
+                                    # e.g. a missing return, the behavior stays the same
+                                    logger.warning("The returned behavior has an incorrect type, keeping the behavior: %s", type(new_behavior))
                         except (trio.EndOfChannel, trio.ClosedResourceError):
                             # Channel has been closed, behavior should be stopped
-                            # catch exception to enable teardown of behavior
-                            run = False
+                            # returning from here still runs the teardown of the behavior
+                            return
                 except TypeError as t:
                     # Behavior or chain has not the correct type.
                     # Abort in this case with an error message and stop
                     logger.error("Behavior has not the correct type: %s", t)
-                    run = False
+                    return
         finally:
             # unregister the ref in the registry
             # TODO: Should be somewhere else...
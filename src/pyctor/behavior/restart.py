@@ -0,0 +1,57 @@
+from contextlib import AsyncExitStack
+from logging import getLogger
+from types import TracebackType
+from typing import Type
+
+import pyctor.behaviors
+import pyctor.types
+
+logger = getLogger(__name__)
+
+
+class CachedRestartBehaviorHandlerImpl(pyctor.types.BehaviorHandler[pyctor.types.T]):
+    """
+    Wraps the Behavior yielded by a setup and restarts it in place when it returns Behaviors.Restart.
+    Only the wrapped Behavior is left and entered again, the setup around it is not run again
+    and its teardown only runs when the Behavior is finally left.
+    """
+
+    __slots__ = ("_behavior", "_context", "_stack", "_handler")
+
+    _behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T]
+    _context: pyctor.types.Context[pyctor.types.T]
+    _stack: AsyncExitStack
+    """
+    Holds the currently entered wrapped Behavior
+    """
+    _handler: pyctor.types.BehaviorHandler[pyctor.types.T]
+
+    def __init__(
+        self,
+        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T],
+        context: pyctor.types.Context[pyctor.types.T],
+    ) -> None:
+        self._behavior = behavior
+        self._context = context
+        self._stack = AsyncExitStack()
+
+    async def __aenter__(self) -> "CachedRestartBehaviorHandlerImpl[pyctor.types.T]":
+        self._handler = await self._stack.enter_async_context(self._behavior(self._context))
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        return await self._stack.__aexit__(exc_type, exc, tb)
+
+    async def handle(self, msg: pyctor.types.T) -> pyctor.types.Behavior[pyctor.types.T]:
+        new_behavior = await self._handler.handle(msg)
+        if new_behavior is pyctor.behaviors.Behaviors.Restart:
+            await self._stack.aclose()
+            self._stack = AsyncExitStack()
+            self._handler = await self._stack.enter_async_context(self._behavior(self._context))
+            return pyctor.behaviors.Behaviors.Same
+        return new_behavior
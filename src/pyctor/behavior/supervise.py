@@ -12,6 +12,8 @@ class SuperviseBehaviorHandlerImpl(pyctor.types.BehaviorHandler[pyctor.types.T])
     Will wrap a BehaviorHandler in a supervise strategy
     """
 
+    __slots__ = ("_strategy", "_behavior")
+
     _strategy: Callable[[Exception], Awaitable[pyctor.types.BehaviorSignal]]
     _behavior: pyctor.types.BehaviorHandler[pyctor.types.T]
 
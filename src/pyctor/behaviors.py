@@ -3,9 +3,13 @@ from logging import getLogger
 from types import FunctionType
 from typing import AsyncContextManager, AsyncGenerator, Awaitable, Callable, Type
 
+import trio
+
 import pyctor._util
 import pyctor.behavior
+import pyctor.behavior.concurrent
 import pyctor.behavior.impl
+import pyctor.behavior.restart
 import pyctor.behavior.supervise
 import pyctor.signals
 import pyctor.types
@@ -14,25 +18,25 @@ logger = getLogger(__name__)
 
 
 class Behaviors:
-    Same: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(1)
+    Same: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(1, "Same")
     """
     Indicates that the Behavior should stay the same for the next message.
     """
 
-    Stop: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(2)
+    Stop: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(2, "Stop")
     """
     Indicates that the Behavior wants to be stopped. 
     A Behavior will get a final 'Stopped' LifecycleSignal and will then be terminated.
     """
 
-    Restart: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(3)
+    Restart: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(3, "Restart")
     """
     Indicates that a Behavior wants to be restarted. 
     That means that the Behavior receives a 'Stopped' and then 'Started' LifecycleSignal.
     Also means that the setup (if available) of the Behavior will be executed again.
     """
 
-    Ignore: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(4)
+    Ignore: pyctor.types.BehaviorSignal = pyctor.signals.BehaviorSignalImpl(4, "Ignore")
     """
     Indicates that the message was not handled and ignored. Will emit a warning
     """
@@ -43,7 +47,7 @@ class Behaviors:
         type_check: Type[pyctor.types.T] | None = None,
     ) -> pyctor.types.BehaviorGeneratorFunction[pyctor.types.T]:
         if not isinstance(func, FunctionType):
-            logger.error(f"Behaviors.receive() was not provided a BehaviorFunction[T]): {type(func)}")
+            logger.error("Behaviors.receive() was not provided a BehaviorFunction[T]): %s", type(func))
             raise TypeError(func)
 
         @asynccontextmanager
@@ -54,13 +58,49 @@ class Behaviors:
 
         return f
 
+    @staticmethod
+    def receive_concurrent(
+        func: pyctor.types.BehaviorFunction[pyctor.types.T],
+        mutating: Callable[[pyctor.types.T], bool],
+    ) -> pyctor.types.BehaviorGeneratorFunction[pyctor.types.T]:
+        """
+        Like receive, but messages for which mutating returns False are handled concurrently.
+        Those messages must not change the state of the behavior and can only return Behaviors.Same.
+        An exception raised while handling them is raised again when the next message is handled,
+        where it can be handled by a supervise strategy like any other exception of the behavior.
+        If no message follows before the behavior is left, the exception is logged.
+        """
+        if not isinstance(func, FunctionType):
+            logger.error("Behaviors.receive_concurrent() was not provided a BehaviorFunction[T]): %s", type(func))
+            raise TypeError(func)
+
+        @asynccontextmanager
+        async def f(
+            c: pyctor.types.Context[pyctor.types.T],
+        ) -> AsyncGenerator[pyctor.types.BehaviorHandler[pyctor.types.T], None]:
+            # leaving the nursery waits for all messages that are still handled
+            async with trio.open_nursery() as n:
+                handler = pyctor.behavior.concurrent.ConcurrentBehaviorHandlerImpl(behavior=func, mutating=mutating, nursery=n)
+                yield handler
+            # a failed message that was not followed by another message must not get lost
+            handler._log_error()
+
+        return f
+
     @staticmethod
     def setup(
         func: Callable[
             [pyctor.types.Context[pyctor.types.T]],
             pyctor.types.BehaviorSetup[pyctor.types.T],
         ],
+        *,
+        cache_restart: bool = False,
     ) -> pyctor.types.BehaviorGeneratorFunction[pyctor.types.T]:
+        """
+        With cache_restart a Behaviors.Restart returned below the setup only restarts the Behavior yielded by the setup.
+        The setup is not run again and its teardown only runs when the Behavior is finally left.
+        Restarts decided outside of the setup, e.g. by a supervise around it, still run the setup again.
+        """
         # if not isinstance(func, Callable[[pyctor.types.Context[pyctor.types.T]], pyctor.types.BehaviorSetup[pyctor.types.T]]):
         #     logger.error(f"Behaviors.setup() was not provided () -> BehaviorSetup[T]): {type(func)}")
         #     raise TypeError(func)
@@ -73,7 +113,7 @@ class Behaviors:
                 # if not isinstance(f, Callable[[str],None]):
                 #     logger.error(f"Behaviors.setup() was not provided () -> BehaviorSetup[T]): {type(f)}")
                 #     raise TypeError(f)
-                m = f(c)
+                m = pyctor.behavior.restart.CachedRestartBehaviorHandlerImpl(behavior=f, context=c) if cache_restart else f(c)
                 # if not isinstance(m, AsyncContextManager):
                 #     logger.error(f"Behaviors.setup() was not provided () -> BehaviorSetup[T]): {type(m)}")
                 #     raise TypeError(m)
@@ -101,3 +141,24 @@ class Behaviors:
                 yield pyctor.behavior.supervise.SuperviseBehaviorHandlerImpl(strategy=strategy, behavior=f)
 
         return f
+
+
+SAME: pyctor.types.BehaviorSignal = Behaviors.Same
+"""
+Module level alias of Behaviors.Same, saves the attribute lookup on Behaviors when returned from a handler.
+"""
+
+STOP: pyctor.types.BehaviorSignal = Behaviors.Stop
+"""
+Module level alias of Behaviors.Stop
+"""
+
+RESTART: pyctor.types.BehaviorSignal = Behaviors.Restart
+"""
+Module level alias of Behaviors.Restart
+"""
+
+IGNORE: pyctor.types.BehaviorSignal = Behaviors.Ignore
+"""
+Module level alias of Behaviors.Ignore
+"""
@@ -0,0 +1,44 @@
+import trio
+
+import pyctor.behavior
+import pyctor.behavior.event_driven
+import pyctor.dispatch.single_process
+import pyctor.system
+import pyctor.types
+
+
+class EventDrivenDispatcher(pyctor.types.Dispatcher):
+    """
+    Dispatcher that runs plain BehaviorHandlers on a pool of worker tasks instead of one task per Behavior.
+    Idle Behaviors then only cost their handler and an empty mailbox.
+    Behaviors with setup and teardown need a task that enters and leaves them,
+    those are started with a task of their own like in the SingleProcessDispatcher.
+    """
+
+    _nursery: trio.Nursery
+    _scheduler: pyctor.behavior.event_driven.EventDrivenScheduler
+    _task_dispatcher: pyctor.dispatch.single_process.SingleProcessDispatcher
+
+    def __init__(self, nursery: trio.Nursery, workers: int) -> None:
+        super().__init__()
+        self._nursery = nursery
+        self._scheduler = pyctor.behavior.event_driven.EventDrivenScheduler(nursery=nursery, workers=workers)
+        self._task_dispatcher = pyctor.dispatch.single_process.SingleProcessDispatcher(nursery=nursery)
+
+    async def dispatch(
+        self,
+        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T] | pyctor.types.BehaviorHandler[pyctor.types.T],
+        name: str,
+    ) -> pyctor.types.Ref[pyctor.types.T]:
+        if not isinstance(behavior, pyctor.types.BehaviorHandler):
+            return await self._task_dispatcher.dispatch(behavior=behavior, name=name)
+
+        # the processor is the mailbox of the behavior
+        processor = pyctor.behavior.event_driven.EventDrivenBehaviorProcessor[pyctor.types.T](behavior=behavior, scheduler=self._scheduler)
+        # register and get ref
+        ref = await pyctor.system.registry.get().register(name=name, channel=processor)
+        # from now on the workers will handle its messages
+        processor.start(ref)
+
+        # return the ref
+        return ref
@@ -7,6 +7,7 @@ import trio
 import cloudpickle # type: ignore
 
 import pyctor.behavior
+import pyctor.behavior.mailbox
 import pyctor.behavior.process
 import pyctor.behaviors
 import pyctor.context
@@ -37,22 +38,19 @@ class MultiProcessState:
     async def ref(self) -> pyctor.types.Ref[pyctor.multiprocess.messages.MultiProcessMessage]:
         async with self._lock:
             if not self._ref:
-                # define channels
-                send: trio.abc.SendChannel
-                receive: trio.abc.ReceiveChannel
                 registry: pyctor.types.Registry = pyctor.system.registry.get()
 
-                # create a new memory channel
-                send, receive = trio.open_memory_channel(0)
+                # create a new mailbox
+                mailbox = pyctor.behavior.mailbox.MailboxImpl[pyctor.multiprocess.messages.MultiProcessMessage](pyctor.behavior.process.MAILBOX_CAPACITY)
                 # register and get ref
-                self._ref = await registry.register(channel=send, name=str(uuid4()))
+                self._ref = await registry.register(channel=mailbox, name=str(uuid4()))
 
                 # server behavior
                 server_behavior = pyctor.multiprocess.server.MultiProcessServerActor.create(max_processes=2)
 
                 # create the process
                 b = pyctor.behavior.process.BehaviorProcessorImpl[pyctor.types.T](
-                    behavior=server_behavior, channel=receive, context=pyctor.context.ContextImpl(self._ref)
+                    behavior=server_behavior, mailbox=mailbox, context=pyctor.context.ContextImpl(self._ref)
                 )
 
                 # start in the nursery
@@ -84,7 +82,7 @@ class MultiProcessDispatcher(pyctor.types.Dispatcher):
 
     async def dispatch(
         self,
-        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T],
+        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T] | pyctor.types.BehaviorHandler[pyctor.types.T],
         name: str,
     ) -> pyctor.types.Ref[pyctor.types.T]:
         # send message to multi process behavior
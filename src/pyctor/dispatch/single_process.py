@@ -1,6 +1,7 @@
 import trio
 
 import pyctor.behavior
+import pyctor.behavior.mailbox
 import pyctor.behavior.process
 import pyctor.context
 import pyctor.system
@@ -21,20 +22,16 @@ class SingleProcessDispatcher(pyctor.types.Dispatcher):
 
     async def dispatch(
         self,
-        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T],
+        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T] | pyctor.types.BehaviorHandler[pyctor.types.T],
         name: str,
     ) -> pyctor.types.Ref[pyctor.types.T]:
-        # define channels
-        send: trio.abc.SendChannel
-        receive: trio.abc.ReceiveChannel
-
-        # create a new memory channel
-        send, receive = trio.open_memory_channel(0)
+        # create a new mailbox
+        mailbox = pyctor.behavior.mailbox.MailboxImpl[pyctor.types.T](pyctor.behavior.process.MAILBOX_CAPACITY)
         # register and get ref
-        ref = await pyctor.system.registry.get().register(name=name, channel=send)
+        ref = await pyctor.system.registry.get().register(name=name, channel=mailbox)
 
         # create the process
-        b = pyctor.behavior.process.BehaviorProcessorImpl[pyctor.types.T](behavior=behavior, channel=receive, context=pyctor.context.ContextImpl(ref))
+        b = pyctor.behavior.process.BehaviorProcessorImpl[pyctor.types.T](behavior=behavior, mailbox=mailbox, context=pyctor.context.ContextImpl(ref))
 
         # start in the nursery
         self._nursery.start_soon(b.behavior_task)
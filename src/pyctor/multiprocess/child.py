@@ -49,7 +49,7 @@ class MultiProcessChildConnectionSendActor:
     async def send(self, buffer: bytes) -> None:
         prefix = len(buffer).to_bytes(4, "big")
         # Write the prefix and buffer to the stream.
-        logger.debug(f"Child: Sending %s on the wire", len(buffer))
+        logger.debug("Child: Sending %s on the wire", len(buffer))
         await self._stream.send_all(prefix)
         await self._stream.send_all(buffer)
 
@@ -63,13 +63,13 @@ class MultiProcessChildConnectionSendActor:
             msg: MultiProcessMessage,
         ) -> Behavior[MultiProcessMessage]:
             # any message we get we send on the wire...
-            print(f"Child-Send: type: {type(msg)} - content: {msg}")
+            logger.debug("Child-Send: type: %s - content: %s", type(msg), msg)
             match msg:
                 case SpawnCommand() | StopCommand() | MessageCommand() | StartedEvent() | StoppedEvent():
                     buffer = self._encoder.encode(msg)
                     await self.send(buffer=buffer)
                 case _:
-                    print(f"Child-Send: ignore type: {type(msg)} - content: {msg}")
+                    logger.debug("Child-Send: ignore type: %s - content: %s", type(msg), msg)
                     return Behaviors.Ignore
             return Behaviors.Same
 
@@ -136,7 +136,7 @@ class MultiProcessChildConnectionReceiveActor:
             ) -> Behavior[MultiProcessMessage]:
                 match msg:
                     case SpawnCommand(reply_to, behavior, name):
-                        print(f"{os.getpid()}: spawn behavior")
+                        logger.debug("%s: spawn behavior", os.getpid())
                         decoded_behavior = cloudpickle.loads(behavior)
                         spawned_ref = await n.spawn(
                             behavior=decoded_behavior, name=name
@@ -148,16 +148,16 @@ class MultiProcessChildConnectionReceiveActor:
                         # send an even to the master that we spawned a child
                         self._remote.send(StartedEvent(spawned_ref))
                     case StopCommand():
-                        print(f" {os.getpid()}: stop ref")
+                        logger.debug("%s: stop ref", os.getpid())
                     case MessageCommand():
-                        print(f" {os.getpid()}: send behavior")
+                        logger.debug("%s: send behavior", os.getpid())
                         type = get_type(msg.type)
                         new_msg = msgspec.msgpack.decode(msg.msg, dec_hook=decode_func(pyctor.configuration._custom_decoder_function), type=type)
                         msg.ref.send(msg=new_msg)
                     case StartedEvent():
-                        print(f" {os.getpid()}: behavior started")
+                        logger.debug("%s: behavior started", os.getpid())
                     case StoppedEvent():
-                        print(f" {os.getpid()}: behavior stopped")
+                        logger.debug("%s: behavior stopped", os.getpid())
                     case _:
                         return Behaviors.Ignore
                 return Behaviors.Same
@@ -1,5 +1,6 @@
 import builtins
 import sys
+from logging import getLogger
 from typing import Any, Callable, Type
 
 from msgspec import Raw, Struct
@@ -8,6 +9,8 @@ import pyctor.ref
 import pyctor.system
 import pyctor.types
 
+logger = getLogger(__name__)
+
 
 class MultiProcessMessage(Struct, tag_field="msg_type", tag=str.lower):
     pass
@@ -50,10 +53,10 @@ def get_type(type_name: str):
 def encode_func(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
     def encode_message(obj: Any) -> Any:
 
-        print(f"Encode type {type(obj)}: {obj}")
+        logger.debug("Encode type %s: %s", type(obj), obj)
         # encode ref
         if isinstance(obj, pyctor.ref.RefImpl):
-            print(str(obj.registry), str(obj.name))
+            logger.debug("Encode ref %s%s", obj.registry, obj.name)
             return (obj.registry, obj.name)
 
         # call custom encoder
@@ -67,7 +70,7 @@ def encode_func(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
 def decode_func(func: Callable[[Type, Any], Any]) -> Callable[[Type, Any], Any]:
     def decode_message(my_type: Type, obj: Any) -> Any:
         # decode ref
-        print(f"Decode type {my_type}: {obj}")
+        logger.debug("Decode type %s: %s", my_type, obj)
         registry: pyctor.types.Registry = pyctor.system.registry.get()
         if my_type == pyctor.ref.RefImpl:
             return registry.ref_from_raw(obj[0], obj[1])
@@ -83,13 +83,14 @@ class RefImpl(pyctor.types.Ref[pyctor.types.T]):
         # get channel from registry
         registry: pyctor.types.Registry = pyctor.system.registry.get()
         channel = registry.channel_from_ref(self)
-        # get nursery from context var
         msg = self.strategy.transform_send_message(self, msg)
 
-        nursery = pyctor.system.nursery.get()
-        if not nursery:
-            raise RuntimeError("No nursery to send message")
-        nursery._nursery.start_soon(self._internal_send, channel, msg)
+        try:
+            # the mailbox takes the message even if it is full, which keeps the order of all messages
+            channel.send_overflow(msg)
+        except (trio.ClosedResourceError, trio.BrokenResourceError):
+            # logger.warning("Could not send message, Behavior already terminated")
+            return
 
     def stop(self) -> None:
         # get channel from registry
@@ -40,7 +40,7 @@ class RegistryImpl(pyctor.types.Registry):
     Each registry in a subprocess will have a higher index determined by the main process.
     With this index a registry can be uniquely identified.
     """
-    _registry: Dict[str, Tuple[pyctor.types.Ref[Any], trio.abc.SendChannel]] = {}
+    _registry: Dict[str, Tuple[pyctor.types.Ref[Any], pyctor.types.Mailbox]] = {}
     """
     Heart of the registry
     """
@@ -51,8 +51,8 @@ class RegistryImpl(pyctor.types.Registry):
     It is important to know that this will only hold watchers in this process.
     Other registries could watch the same behavior just with different watchers. 
     """
-    _remotes: Dict[str, trio.abc.SendChannel] = {}
-    _default_remote: trio.abc.SendChannel = None
+    _remotes: Dict[str, pyctor.types.Mailbox] = {}
+    _default_remote: pyctor.types.Mailbox = None
 
     def __init__(self) -> None:
         # determine registry name
@@ -76,15 +76,17 @@ class RegistryImpl(pyctor.types.Registry):
     async def deregister(self, ref: pyctor.types.Ref[pyctor.types.T]) -> None:
         # remove from dict and call watchers
         async with self._lock:
-            logger.info(f"Deregister ref: {ref.url}")
+            logger.info("Deregister ref: %s", ref.url)
             if ref.url in self._registry:
-                # available, so call watchers and remove from dict
-                for entry in self._watchers[ref.url]:
+                # available, so call watchers and remove from dict.
+                # The watchers are removed as well, otherwise every stopped behavior would be kept
+                # in there and later watchers would wait for a termination that already happened.
+                for entry in self._watchers.pop(ref.url, []):
                     entry["ref"].send(entry["msg"])
                 # remove from dict
                 del self._registry[ref.url] 
 
-    async def register(self, name: str, channel: trio.abc.SendChannel[pyctor.types.T]) -> pyctor.types.Ref[pyctor.types.T]:
+    async def register(self, name: str, channel: pyctor.types.Mailbox[pyctor.types.T]) -> pyctor.types.Ref[pyctor.types.T]:
         async with self._lock:
             if self._url + name in self._registry:
                 raise ValueError(f"Ref {name} is already registered")
@@ -112,7 +114,7 @@ class RegistryImpl(pyctor.types.Registry):
             except trio.WouldBlock:
                 return pyctor.ref.RefImpl(registry=registry, name=name, strategy=remoteMessageStrategy)
 
-    def channel_from_ref(self, ref: pyctor.types.Ref[pyctor.types.T]) -> trio.abc.SendChannel[pyctor.types.T]:
+    def channel_from_ref(self, ref: pyctor.types.Ref[pyctor.types.T]) -> pyctor.types.Mailbox[pyctor.types.T]:
         if ref.url in self._registry:
             return self._registry[ref.url][1]
         raise ValueError(f"No Behavior with ref '{ref.url}'")
@@ -1,16 +1,36 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Tuple
 
 import pyctor.types
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class BehaviorSignalImpl(pyctor.types.BehaviorSignal):
     """
-    A class to house all BehaviorSignal that can be returned by a Behavior
+    A class to house all BehaviorSignal that can be returned by a Behavior.
+    Signals are singletons and compare by identity only.
     """
 
     __index: int
     """
     The index is used to differentiate the different signals like Started, Stopped, etc
     """
+
+    __name: str
+    """
+    The name of the signal on Behaviors, used to find the singleton again when unpickled
+    """
+
+    def __reduce__(self) -> Tuple[Callable[[str], pyctor.types.BehaviorSignal], Tuple[str]]:
+        # signals are compared by identity, so unpickling has to return the singleton instead of a copy
+        return (_signal, (self.__name,))
+
+
+def _signal(name: str) -> pyctor.types.BehaviorSignal:
+    """
+    Returns the signal with the given name from Behaviors.
+    """
+    # imported here, pyctor.behaviors creates the signals and therefore imports this module
+    import pyctor.behaviors
+
+    return getattr(pyctor.behaviors.Behaviors, name)
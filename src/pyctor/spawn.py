@@ -33,7 +33,7 @@ class SpawnerImpl(pyctor.types.Spawner):
 
     async def spawn(
         self,
-        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T],
+        behavior: pyctor.types.BehaviorGeneratorFunction[pyctor.types.T] | pyctor.types.BehaviorHandler[pyctor.types.T],
         name: str | None = None,
     ) -> pyctor.types.Ref[pyctor.types.T]:
 
@@ -5,6 +5,7 @@ from typing import AsyncGenerator
 
 import trio
 
+import pyctor.dispatch.event_driven
 import pyctor.dispatch.multi_process
 import pyctor.dispatch.single_process
 import pyctor.spawn
@@ -35,23 +36,42 @@ class BehaviorNurseryImpl(pyctor.spawn.SpawnerImpl, pyctor.types.BehaviorNursery
 
 @asynccontextmanager
 async def open_nursery() -> AsyncGenerator[pyctor.types.BehaviorNursery, None]:
+    previous = nursery.get(None)
     try:
         async with trio.open_nursery() as n:
             behavior_nursery = BehaviorNurseryImpl(nursery=n, dispatcher=pyctor.dispatch.single_process.SingleProcessDispatcher(nursery=n))
             nursery.set(behavior_nursery)
             yield behavior_nursery
     finally:
-        nursery.set(None)  # type: ignore
+        # restore the nursery of the enclosing scope, e.g. after an ask within a handler
+        nursery.set(previous)  # type: ignore
 
 
 @asynccontextmanager
 async def open_multiprocess_nursery(
     processes: int = multiprocessing.cpu_count(),
 ) -> AsyncGenerator[pyctor.types.BehaviorNursery, None]:
+    previous = nursery.get(None)
     try:
         async with trio.open_nursery() as n:
             behavior_nursery = BehaviorNurseryImpl(nursery=n, dispatcher=pyctor.dispatch.multi_process.MultiProcessDispatcher(nursery=n, processes=processes))
             nursery.set(behavior_nursery)
             yield behavior_nursery
     finally:
-        nursery.set(None)  # type: ignore
+        # restore the nursery of the enclosing scope, e.g. after an ask within a handler
+        nursery.set(previous)  # type: ignore
+
+
+@asynccontextmanager
+async def open_event_driven_nursery(
+    workers: int = 1,
+) -> AsyncGenerator[pyctor.types.BehaviorNursery, None]:
+    previous = nursery.get(None)
+    try:
+        async with trio.open_nursery() as n:
+            behavior_nursery = BehaviorNurseryImpl(nursery=n, dispatcher=pyctor.dispatch.event_driven.EventDrivenDispatcher(nursery=n, workers=workers))
+            nursery.set(behavior_nursery)
+            yield behavior_nursery
+    finally:
+        # restore the nursery of the enclosing scope, e.g. after an ask within a handler
+        nursery.set(previous)  # type: ignore
@@ -33,6 +33,8 @@ class BehaviorHandler(Protocol[T]):
     This class fullfills the Protocol requirements needed to handle the internals.
     """
 
+    __slots__ = ()
+
     async def handle(self, msg: T) -> "Behavior[T]":
         """
         Whenever a new message is received by the Behavior the handle method is called.
@@ -43,7 +45,7 @@ class BehaviorHandler(Protocol[T]):
 
 
 class BehaviorSignal(ABC):
-    ...  # pragma: no cover
+    __slots__ = ()
 
 
 class Context(Generic[T]):
@@ -73,10 +75,11 @@ A ContextManager that will yield a BehaviorHandler that can be used to handle me
 
 BehaviorGeneratorFunction: TypeAlias = Callable[[Context[T]], BehaviorGenerator[T]]
 
-Behavior: TypeAlias = Callable[[Context[T]], BehaviorGenerator[T]] | BehaviorSignal
+Behavior: TypeAlias = Callable[[Context[T]], BehaviorGenerator[T]] | BehaviorHandler[T] | BehaviorSignal
 """
 The basic building block of everything.
 A Behavior defines how an actor will handle a message and will return a Behavior for the next message.
+A BehaviorHandler without setup and teardown can be used as a Behavior directly.
 """
 
 BehaviorFunction: TypeAlias = Callable[[T], Awaitable[Behavior[T]]]
@@ -96,7 +99,7 @@ class Spawner(ABC):
     @abstractmethod
     async def spawn(
         self,
-        behavior: BehaviorGeneratorFunction[T],
+        behavior: BehaviorGeneratorFunction[T] | BehaviorHandler[T],
         name: str | None = None,
     ) -> "Ref[T]":
         """
@@ -122,10 +125,29 @@ class Spawner(ABC):
 
 
 class BehaviorProcessor(Protocol):
+    __slots__ = ()
+
     async def behavior_task(self):
         ...  # pragma: no cover
 
 
+class Mailbox(trio.abc.SendChannel[T]):
+    """
+    The channel a Behavior is registered with in the registry.
+    Besides the trio SendChannel interface a mailbox can always take a message without waiting.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def send_overflow(self, msg: T) -> None:
+        """
+        Queues the message even if the mailbox is full and keeps the order of all messages sent to the mailbox.
+        Raises trio.ClosedResourceError or trio.BrokenResourceError if the mailbox does not take messages anymore.
+        """
+        ...  # pragma: no cover
+
+
 class ReplyProtocol(Protocol[V]):
     """
     Defines the interface that is needed if the ask pattern is being used with the system.
@@ -248,7 +270,7 @@ class Dispatcher(ABC):
 
     async def dispatch(
         self,
-        behavior: BehaviorGeneratorFunction[T],
+        behavior: BehaviorGeneratorFunction[T] | BehaviorHandler[T],
         name: str,
     ) -> Ref[T]:
         """
@@ -280,7 +302,7 @@ class Registry:
         ...
 
     @abstractmethod
-    async def register(self, name: str, channel: trio.abc.SendChannel[T]) -> Ref[T]:
+    async def register(self, name: str, channel: Mailbox[T]) -> Ref[T]:
         ...
 
     @abstractmethod
@@ -288,7 +310,7 @@ class Registry:
         ...
 
     @abstractmethod
-    def channel_from_ref(self, ref: Ref[T]) -> trio.abc.SendChannel[T]:
+    def channel_from_ref(self, ref: Ref[T]) -> Mailbox[T]:
         ...
 
     @abstractmethod
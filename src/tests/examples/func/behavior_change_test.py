@@ -2,7 +2,7 @@ import trio
 
 import pyctor
 from pyctor.behaviors import Behaviors
-from pyctor.types import Behavior
+from pyctor.types import Behavior, BehaviorSetup, Context
 
 
 def test_behavior_change():
@@ -35,3 +35,62 @@ def test_behavior_change():
 
     trio.run(main)
     assert counter == 6
+
+
+def test_behavior_change_batch():
+    handled = []
+
+    async def first_handler(msg: int) -> Behavior[int]:
+        handled.append(("first", msg))
+        if msg == 2:
+            return Behaviors.receive(second_handler)
+        return Behaviors.Same
+
+    async def second_handler(msg: int) -> Behavior[int]:
+        handled.append(("second", msg))
+        if msg == 5:
+            return Behaviors.Stop
+        return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(first_handler))
+                # all messages are received as one batch, the change happens in the middle of it
+                for i in range(6):
+                    ref.send(i)
+
+    trio.run(main)
+    assert handled == [("first", 0), ("first", 1), ("first", 2), ("second", 3), ("second", 4), ("second", 5)]
+
+
+def test_restart_batch():
+    handled = []
+    setups = 0
+
+    async def setup(_: Context[int]) -> BehaviorSetup[int]:
+        nonlocal setups
+        setups += 1
+        current = setups
+
+        async def setup_handler(msg: int) -> Behavior[int]:
+            handled.append((current, msg))
+            if msg == 2:
+                return Behaviors.Restart
+            if msg == 5:
+                return Behaviors.Stop
+            return Behaviors.Same
+
+        yield Behaviors.receive(setup_handler)
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.setup(setup))
+                # all messages are received as one batch, the restart happens in the middle of it
+                for i in range(6):
+                    ref.send(i)
+
+    trio.run(main)
+    assert setups == 2
+    assert handled == [(1, 0), (1, 1), (1, 2), (2, 3), (2, 4), (2, 5)]
@@ -0,0 +1,98 @@
+import pytest
+import trio
+
+import pyctor
+from pyctor.behaviors import Behaviors
+from pyctor.types import Behavior, BehaviorSignal
+
+
+def test_concurrent():
+    running = 0
+    max_running = 0
+    handled = []
+
+    async def handler(msg: str) -> Behavior[str]:
+        nonlocal running
+        nonlocal max_running
+        if msg == "stop":
+            handled.append(msg)
+            return Behaviors.Stop
+        running += 1
+        max_running = max(max_running, running)
+        await trio.sleep(0.01)
+        running -= 1
+        handled.append(msg)
+        return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            concurrent_behavior = Behaviors.receive_concurrent(handler, mutating=lambda msg: msg == "stop")
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(concurrent_behavior)
+                for i in range(3):
+                    ref.send("get")
+                ref.send("stop")
+
+    trio.run(main)
+    assert max_running == 3
+    assert handled == ["get", "get", "get", "stop"]
+
+
+def test_concurrent_failure():
+    errors = []
+    other_handled = 0
+
+    async def handler(msg: str) -> Behavior[str]:
+        if msg == "fail":
+            await trio.sleep(0.01)
+            raise ValueError(msg)
+        return Behaviors.Same
+
+    async def strategy(e: Exception) -> BehaviorSignal:
+        errors.append(e)
+        return Behaviors.Stop
+
+    async def other_handler(msg: str) -> Behavior[str]:
+        nonlocal other_handled
+        other_handled += 1
+        return Behaviors.Stop
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            concurrent_behavior = Behaviors.receive_concurrent(handler, mutating=lambda msg: msg == "write")
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.supervise(strategy, concurrent_behavior))
+                other_ref = await n.spawn(Behaviors.receive(other_handler))
+                ref.send("fail")
+                # waits for the failed message and then raises its exception
+                ref.send("write")
+                other_ref.send("other")
+
+    trio.run(main)
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+    assert other_handled == 1
+
+
+def test_concurrent_failure_stopped(caplog: pytest.LogCaptureFixture):
+    errors = []
+
+    async def handler(msg: str) -> Behavior[str]:
+        raise ValueError(msg)
+
+    async def strategy(e: Exception) -> BehaviorSignal:
+        errors.append(e)
+        return Behaviors.Stop
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            concurrent_behavior = Behaviors.receive_concurrent(handler, mutating=lambda msg: False)
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.supervise(strategy, concurrent_behavior))
+                ref.send("fail")
+                # no message follows the failed one, the exception is logged when the behavior is left
+                ref.stop()
+
+    trio.run(main)
+    assert errors == []
+    assert any(isinstance(record.exc_info[1], ValueError) for record in caplog.records if record.exc_info)
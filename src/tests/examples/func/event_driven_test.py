@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from typing import AsyncContextManager, Callable, List, Tuple
+
+import trio
+
+import pyctor
+from pyctor.behaviors import Behaviors
+from pyctor.types import Behavior, BehaviorNursery, Ref
+
+
+def test_event_driven():
+    counter = 0
+
+    class CountingHandler:
+        async def handle(self, msg: int) -> Behavior[int]:
+            nonlocal counter
+            counter += 1
+            if msg == 9:
+                return Behaviors.Stop
+            return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_event_driven_nursery(workers=2) as n:
+                refs = [await n.spawn(CountingHandler()) for _ in range(100)]
+                for i in range(10):
+                    for ref in refs:
+                        ref.send(i)
+
+    trio.run(main)
+    assert counter == 1000
+
+
+def test_event_driven_with_setup():
+    counter = 0
+
+    class CountingHandler:
+        async def handle(self, msg: int) -> Behavior[int]:
+            nonlocal counter
+            counter += 1
+            return Behaviors.Stop
+
+    async def message_handler(msg: int) -> Behavior[int]:
+        nonlocal counter
+        counter += 10
+        return Behaviors.Stop
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_event_driven_nursery(workers=2) as n:
+                # runs on the workers
+                handler_ref = await n.spawn(CountingHandler())
+                # needs a task of its own
+                receive_ref = await n.spawn(Behaviors.receive(message_handler))
+                handler_ref.send(0)
+                receive_ref.send(0)
+
+    trio.run(main)
+    assert counter == 11
+
+
+def test_event_driven_ask():
+    answers = []
+
+    @dataclass
+    class Request:
+        value: int
+        reply_to: Ref[int]
+
+    class Server:
+        async def handle(self, msg: Request) -> Behavior[Request]:
+            msg.reply_to.send(msg.value * 2)
+            return Behaviors.Same
+
+    class Client:
+        def __init__(self, server: Ref[Request]) -> None:
+            self._server = server
+
+        async def handle(self, msg: int) -> Behavior[int]:
+            # waits for another event driven behavior while the only worker is busy with this handler
+            answers.append(await self._server.ask(lambda x: Request(value=msg, reply_to=x)))
+            if msg == 2:
+                self._server.stop()
+                return Behaviors.Stop
+            return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_event_driven_nursery(workers=1) as n:
+                server_ref = await n.spawn(Server())
+                client_ref = await n.spawn(Client(server_ref))
+                for i in range(3):
+                    client_ref.send(i)
+
+    trio.run(main)
+    assert answers == [0, 2, 4]
+
+
+def test_event_driven_behavior_change():
+    async def run(open_nursery: Callable[[], AsyncContextManager[BehaviorNursery]]) -> List[Tuple[str, int]]:
+        handled = []
+
+        async def message_handler(msg: int) -> Behavior[int]:
+            handled.append(("receive", msg))
+            if msg == 4:
+                return Behaviors.Stop
+            return Behaviors.Same
+
+        class SwitchingHandler:
+            async def handle(self, msg: int) -> Behavior[int]:
+                handled.append(("handler", msg))
+                if msg == 1:
+                    # needs a task of its own from now on
+                    return Behaviors.receive(message_handler)
+                return Behaviors.Same
+
+        with trio.fail_after(1):
+            async with open_nursery() as n:
+                ref = await n.spawn(SwitchingHandler())
+                for i in range(5):
+                    ref.send(i)
+        return handled
+
+    async def main() -> None:
+        handled = await run(pyctor.open_event_driven_nursery)
+        assert handled == [("handler", 0), ("handler", 1), ("receive", 2), ("receive", 3), ("receive", 4)]
+        assert handled == await run(pyctor.open_nursery)
+
+    trio.run(main)
+
+
+def test_event_driven_restart():
+    async def run(open_nursery: Callable[[], AsyncContextManager[BehaviorNursery]]) -> List[int]:
+        handled = []
+
+        class RestartingHandler:
+            async def handle(self, msg: int) -> Behavior[int]:
+                handled.append(msg)
+                if msg == 4:
+                    return Behaviors.Stop
+                # a plain handler has no setup, it handles the next message like before
+                return Behaviors.Restart
+
+        with trio.fail_after(1):
+            async with open_nursery() as n:
+                ref = await n.spawn(RestartingHandler())
+                for i in range(5):
+                    ref.send(i)
+        return handled
+
+    async def main() -> None:
+        handled = await run(pyctor.open_event_driven_nursery)
+        assert handled == [0, 1, 2, 3, 4]
+        assert handled == await run(pyctor.open_nursery)
+
+    trio.run(main)
+
+
+def test_event_driven_cancelled_send():
+    handled = []
+
+    class RecordingHandler:
+        async def handle(self, msg: str) -> Behavior[str]:
+            handled.append(msg)
+            return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_event_driven_nursery() as n:
+                ref = await n.spawn(RecordingHandler())
+                channel = pyctor.system.registry.get().channel_from_ref(ref)
+                with trio.CancelScope() as cancel_scope:
+                    cancel_scope.cancel()
+                    await channel.send("cancelled")
+                await channel.send("sent")
+                ref.stop()
+
+    trio.run(main)
+    assert handled == ["sent"]
@@ -0,0 +1,61 @@
+from typing import Any
+
+import trio
+
+import pyctor
+from pyctor.behaviors import Behaviors
+from pyctor.types import Behavior
+
+
+def test_handler():
+    counter = 0
+
+    class CountingHandler:
+        async def handle(self, msg: int) -> Behavior[int]:
+            nonlocal counter
+            counter += 1
+            if msg == 1:
+                # switch to another plain handler
+                return StoppingHandler()
+            return Behaviors.Same
+
+    class StoppingHandler:
+        async def handle(self, msg: int) -> Behavior[int]:
+            nonlocal counter
+            counter += 10
+            return Behaviors.Stop
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(CountingHandler())
+                for i in range(3):
+                    ref.send(i)
+
+    trio.run(main)
+    assert counter == 12
+
+
+def test_handler_type_check_switch():
+    handled = []
+
+    async def typed_handler(msg: int) -> Behavior[int]:
+        handled.append(("typed", msg))
+        if msg == 3:
+            return Behaviors.Stop
+        return Behaviors.receive(untyped_handler)
+
+    async def untyped_handler(msg: Any) -> Behavior[Any]:
+        handled.append(("untyped", msg))
+        return Behaviors.receive(typed_handler, type_check=int)
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(typed_handler, type_check=int))
+                # every message switches between a type checked and an unchecked behavior
+                for msg in (0, "a", 1, "b", 2, "c", 3):
+                    ref.send(msg)
+
+    trio.run(main)
+    assert handled == [("typed", 0), ("untyped", "a"), ("typed", 1), ("untyped", "b"), ("typed", 2), ("untyped", "c"), ("typed", 3)]
@@ -0,0 +1,157 @@
+import trio
+import trio.testing
+
+import pyctor
+from pyctor.behavior.mailbox import MailboxImpl
+from pyctor.behavior.process import MAILBOX_CAPACITY
+from pyctor.behaviors import Behaviors
+from pyctor.types import Behavior
+
+
+def test_mailbox_capacity():
+    counter = 0
+
+    async def message_handler(msg: int) -> Behavior[int]:
+        nonlocal counter
+        counter += 1
+        if counter == 3 * MAILBOX_CAPACITY:
+            return Behaviors.Stop
+        return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(message_handler))
+                for i in range(3 * MAILBOX_CAPACITY):
+                    ref.send(i)
+
+    trio.run(main)
+    assert counter == 3 * MAILBOX_CAPACITY
+
+
+def test_mailbox_stop_blocked():
+    handled = []
+    broken = 0
+
+    async def main() -> None:
+        nonlocal broken
+        with trio.fail_after(1):
+            release = trio.Event()
+
+            async def message_handler(msg: int) -> Behavior[int]:
+                handled.append(msg)
+                # keep the mailbox full until all senders are blocked
+                await release.wait()
+                return Behaviors.Stop
+
+            async def blocked_send(msg: int) -> None:
+                nonlocal broken
+                try:
+                    await mailbox.send(msg)
+                except trio.BrokenResourceError:
+                    broken += 1
+
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(message_handler))
+                mailbox = pyctor.system.registry.get().channel_from_ref(ref)
+                ref.send(0)
+                await trio.testing.wait_all_tasks_blocked()
+                # the behavior is handling the first message, fill the mailbox
+                for i in range(MAILBOX_CAPACITY):
+                    ref.send(i + 1)
+                async with trio.open_nursery() as senders:
+                    for i in range(3):
+                        senders.start_soon(blocked_send, i)
+                    await trio.testing.wait_all_tasks_blocked()
+                    release.set()
+
+    trio.run(main)
+    assert handled == [0]
+    assert broken == 3
+
+
+def test_mailbox_stop_drains():
+    handled = []
+
+    async def message_handler(msg: int) -> Behavior[int]:
+        handled.append(msg)
+        return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(message_handler))
+                for i in range(100):
+                    ref.send(i)
+                ref.stop()
+
+    trio.run(main)
+    assert handled == list(range(100))
+
+
+def test_mailbox_cancelled_send():
+    async def main() -> None:
+        with trio.fail_after(1):
+            mailbox = MailboxImpl[str](1)
+            mailbox.send_nowait("queued")
+            cancel_scope = trio.CancelScope()
+
+            async def cancelled_send() -> None:
+                with cancel_scope:
+                    await mailbox.send("cancelled")
+
+            async with trio.open_nursery() as n:
+                n.start_soon(cancelled_send)
+                await trio.testing.wait_all_tasks_blocked()
+                n.start_soon(mailbox.send, "blocked")
+                await trio.testing.wait_all_tasks_blocked()
+                cancel_scope.cancel()
+                await trio.testing.wait_all_tasks_blocked()
+                assert list(await mailbox.receive_batch()) == ["queued"]
+                # the message of the cancelled sender is never delivered
+                assert list(await mailbox.receive_batch()) == ["blocked"]
+            await mailbox.aclose()
+            try:
+                await mailbox.receive_batch()
+                assert False, "Mailbox should have ended"
+            except trio.EndOfChannel:
+                pass
+
+    trio.run(main)
+
+
+def test_mailbox_order():
+    handled = []
+
+    async def message_handler(msg: int) -> Behavior[int]:
+        handled.append(msg)
+        if len(handled) == 5 * MAILBOX_CAPACITY:
+            return Behaviors.Stop
+        return Behaviors.Same
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(message_handler))
+                # more messages than the mailbox can buffer keep their order
+                for i in range(5 * MAILBOX_CAPACITY):
+                    ref.send(i)
+
+    trio.run(main)
+    assert handled == list(range(5 * MAILBOX_CAPACITY))
+
+
+def test_mailbox_cancelled_send_with_room():
+    async def main() -> None:
+        mailbox = MailboxImpl[str](1)
+        with trio.CancelScope() as cancel_scope:
+            cancel_scope.cancel()
+            await mailbox.send("cancelled")
+        await mailbox.aclose()
+        try:
+            await mailbox.receive_batch()
+            assert False, "Mailbox should have ended without messages"
+        except trio.EndOfChannel:
+            pass
+
+    trio.run(main)
@@ -47,5 +47,41 @@ def test_restart():
     trio.run(main)
     assert counter == 16
 
+
+def test_restart_cached():
+    setup_counter = 0
+    teardown_counter = 0
+    handled = 0
+
+    async def setup(_: Context[int]) -> BehaviorSetup[int]:
+        nonlocal setup_counter
+        nonlocal teardown_counter
+
+        setup_counter += 1
+
+        async def setup_handler(msg: int) -> Behavior[int]:
+            nonlocal handled
+            handled += 1
+            if msg == 5:
+                return Behaviors.Stop
+            return Behaviors.Restart
+
+        yield Behaviors.receive(setup_handler)
+
+        teardown_counter += 1
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            setup_behavior = Behaviors.setup(setup, cache_restart=True)
+            async with pyctor.open_nursery() as n:
+                setup_ref = await n.spawn(setup_behavior)
+                for i in range(6):
+                    setup_ref.send(i)
+
+    trio.run(main)
+    assert setup_counter == 1
+    assert teardown_counter == 1
+    assert handled == 6
+
 if __name__ == "__main__":
     test_restart()
@@ -0,0 +1,34 @@
+import pickle
+
+import trio
+
+import pyctor
+from pyctor.behaviors import Behaviors
+from pyctor.types import Behavior
+
+
+def test_signal_pickle():
+    for signal in [Behaviors.Same, Behaviors.Stop, Behaviors.Restart, Behaviors.Ignore]:
+        assert pickle.loads(pickle.dumps(signal)) is signal
+
+
+def test_unknown_behavior():
+    counter = 0
+
+    async def message_handler(msg: int) -> Behavior[int]:
+        nonlocal counter
+        counter += 1
+        if msg == 2:
+            return Behaviors.Stop
+        # not a behavior, keeps the behavior with a warning
+        return None  # type: ignore
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                ref = await n.spawn(Behaviors.receive(message_handler))
+                for i in range(3):
+                    ref.send(i)
+
+    trio.run(main)
+    assert counter == 3
@@ -1,4 +1,5 @@
 import trio
+import trio.testing
 
 import pyctor
 from pyctor.behaviors import Behaviors
@@ -46,5 +47,36 @@ def test_watch():
     trio.run(main)
     assert counter == 11
 
+
+def test_watch_stopped():
+    counter = 0
+
+    async def message_handler(msg: int) -> Behavior[int]:
+        return Behaviors.Stop
+
+    async def setup(ctx: Context[str]) -> BehaviorSetup[str]:
+        async with pyctor.open_nursery() as n:
+            child_ref = await n.spawn(Behaviors.receive(message_handler))
+            child_ref.send(0)
+            # let the child stop before it is watched
+            await trio.testing.wait_all_tasks_blocked()
+
+            await ctx.watch(child_ref, "TERMINATED!!!!")
+
+            async def setup_handler(msg: str) -> Behavior[str]:
+                nonlocal counter
+                counter += 1
+                return Behaviors.Stop
+
+            yield Behaviors.receive(setup_handler)
+
+    async def main() -> None:
+        with trio.fail_after(1):
+            async with pyctor.open_nursery() as n:
+                await n.spawn(Behaviors.setup(setup))
+
+    trio.run(main)
+    assert counter == 1
+
 if __name__ == "__main__":
     test_watch()
\ No newline at end of file